@@ -1,4 +1,5 @@
 import random
+from functools import lru_cache
 
 
 def caesar_cipher(k):
@@ -8,9 +9,81 @@ def caesar_cipher(k):
         k (int): the shift key
 
     Returns:
-        function: the shift function
+        function: the shift function, tagged with its shift so callers can specialize on it and with a vectorized form that shifts a whole sequence at once
     """
-    return lambda x: (x + k) % 26
+    shift_function = lambda x: (x + k) % 26
+    shift_function.shift = k
+    shift_function.vectorized = lambda codes: caesar_cipher_batch(k, codes)
+    return shift_function
+
+
+def affine_cipher(a, b):
+    """Generates an affine function based on the keys a and b.
+
+    Args:
+        a (int): the multiplicative key
+        b (int): the additive key
+
+    Returns:
+        function: the affine function, with a vectorized form that applies it to a whole sequence at once
+    """
+    affine_function = lambda x: (a * x + b) % 26
+    affine_function.vectorized = lambda codes: affine_cipher_batch(a, b, codes)
+    return affine_function
+
+
+@lru_cache(maxsize=26)
+def caesar_table(k):
+    """Generates the 256 entry bytes.translate table for the shift key k.
+
+    Args:
+        k (int): the shift key
+
+    Returns:
+        bytes: the table mapping each numeric representation from 0 to 25 to its shifted value, and every other byte to itself
+    """
+    return bytes((i + k) % 26 if i < 26 else i for i in range(256))
+
+
+def caesar_cipher_batch(k, codes):
+    """Applies the shift k to a whole sequence of numeric representations at once.
+
+    Args:
+        k (int): the shift key
+        codes (bytes): the numeric representations to shift, values outside 0 to 25 are left unchanged
+
+    Returns:
+        bytes: the shifted numeric representations
+    """
+    return bytes(codes).translate(caesar_table(k % 26))
+
+
+@lru_cache(maxsize=None)
+def affine_table(a, b):
+    """Generates the 256 entry bytes.translate table for the affine keys a and b.
+
+    Args:
+        a (int): the multiplicative key
+        b (int): the additive key
+
+    Returns:
+        bytes: the table mapping each numeric representation from 0 to 25 to a * x + b mod 26, and every other byte to itself
+    """
+    return bytes((a * i + b) % 26 if i < 26 else i for i in range(256))
+
+
+def affine_cipher_batch(a, b, codes):
+    """Applies the affine function a * x + b mod 26 to a whole sequence of numeric representations at once.
+
+    Args:
+        a (int): the multiplicative key
+        b (int): the additive key
+        codes (bytes): the numeric representations to transform, values outside 0 to 25 are left unchanged
+
+    Returns:
+        bytes: the transformed numeric representations
+    """
+    return bytes(codes).translate(affine_table(a % 26, b % 26))
 
 
 def transposition_cipher(sigma):
@@ -20,8 +93,9 @@ def transposition_cipher(sigma):
         sigma (list): the key
 
     Returns:
-        function: the transposition function
+        function: the transposition function, tagged with sigma so callers can apply it to a whole list at once
     """
+    k = len(sigma)
 
     def transposition_function(p_arr, i):
         """Transposition function.
@@ -33,9 +107,8 @@ def transposition_cipher(sigma):
         Returns:
             int: the numeric representation of the encrypted character
         """
-        div = i // len(sigma)
-        mod = i % len(sigma)
-        idx = div * len(sigma) + sigma[mod]
-        return p_arr[idx]
+        div, mod = divmod(i, k)
+        return p_arr[div * k + sigma[mod]]
 
+    transposition_function.sigma = sigma
     return transposition_function
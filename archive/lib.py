@@ -1,4 +1,12 @@
+from array import array
 from inspect import signature
+from string import ascii_lowercase
+
+
+# bytes.translate tables between ASCII codes and numeric representations, each stored as
+# a signed byte so an array("b") over the translated bytes holds the representations
+_NUMERIC_TABLE = bytes((i - ord("a")) % 256 for i in range(256))
+_CHARACTER_TABLE = bytes((i + ord("a")) % 256 for i in range(256))
 
 
 def numeric_representation(c):
@@ -25,55 +33,24 @@ def character_representation(n):
     return chr(ord("a") + n)
 
 
-def function_wrapper(f):
-    """Create a wrapper function for a given encryption function.
+def apply_encryption_function(f, p_arr):
+    """Apply an encryption function to every numeric representation in a list.
+
+    The arity of f is checked once up front instead of on every character.
 
     Args:
         f (function): the encryption function (inputs and outputs a numeric representation).
+        p_arr (array): array of the numeric representations of the characters to encrypt.
 
     Returns:
-        function: the wrapper function.
+        list: list of the encrypted numeric representations of the characters, a packed array("b") when f has a vectorized form and p_arr is packed.
     """
-
-    sig = signature(f)
-
-    if len(sig.parameters) == 1:
-
-        def wrapper(p_arr, i):
-            """Wrapper function for a given encryption function
-
-            Args:
-                p_arr (list): list of the numeric representations of the characters to encrypt.
-                i (int): the index of the character to encrypt.
-
-            Returns:
-                int: the encrypted numeric representation of the character.
-            """
-            if type(p_arr) != list or type(i) != int or i < 0 or i >= len(p_arr):
-                return "?"
-            p = p_arr[i]
-            if type(p) != int or p < 0 or p > 25:
-                return p
-            return f(p)
-
-        return wrapper
-    else:
-
-        def wrapper(p_arr, i):
-            """Wrapper function for a given encryption function
-
-            Args:
-                p_arr (list): list of the numeric representations of the characters to encrypt.
-                i (int): the index of the character to encrypt.
-
-            Returns:
-                int: the encrypted numeric representation of the character.
-            """
-            if type(p_arr) != list or type(i) != int or i < 0 or i >= len(p_arr):
-                return "?"
-            return f(p_arr, i)
-
-        return wrapper
+    vectorized = getattr(f, "vectorized", None)
+    if vectorized is not None and getattr(p_arr, "typecode", None) == "b":
+        return array("b", vectorized(p_arr))
+    if len(signature(f).parameters) == 1:
+        return [f(p) if 0 <= p <= 25 else p for p in p_arr]
+    return [f(p_arr, i) for i in range(len(p_arr))]
 
 
 def print_encryption_table(
@@ -98,41 +75,44 @@ def print_encryption_table(
         string: the encrypted string.
     """
 
-    f = function_wrapper(f)
-
-    print(f"Encryption Table - {name}:" if name else "Encryption Table:")
     i_arr = list(range(len(s)))
     s_arr = list(s)
-    p_arr = [numeric_representation(c) for c in s_arr]
-    q_arr = [f(p_arr, i) for i in i_arr]
-    t_arr = [character_representation(q) for q in q_arr]
+    if s.isascii():
+        p_arr = array("b", s.encode("ascii").translate(_NUMERIC_TABLE))
+    else:
+        p_arr = array("i", map(numeric_representation, s_arr))
+    q_arr = apply_encryption_function(f, p_arr)
+    if getattr(q_arr, "typecode", None) == "b":
+        t_arr = list(bytes(q_arr).translate(_CHARACTER_TABLE).decode("latin-1"))
+    else:
+        t_arr = [character_representation(q) for q in q_arr]
 
-    i_str = "".join(["{:^" + str(cell_width) + "}|" for _ in i_arr])
-    s_str = "".join(["{:^" + str(cell_width) + "}|" for _ in s_arr])
-    p_str = "".join(["{:^" + str(cell_width) + "}|" for _ in p_arr])
-    q_str = "".join(["{:^" + str(cell_width) + "}|" for _ in q_arr])
-    t_str = "".join(["{:^" + str(cell_width) + "}|" for _ in t_arr])
+    row_str = ("{:^" + str(cell_width) + "}|") * len(i_arr)
 
-    i_str = f"{'i':^{cell_width}}|" + i_str.format(*preprocess(i_arr))
+    i_str = f"{'i':^{cell_width}}|" + row_str.format(*preprocess(i_arr))
     line_str = "-" * len(i_str)
 
-    print(line_str)
-    print(i_str)
+    rows = [f"Encryption Table - {name}:" if name else "Encryption Table:"]
+
+    rows.append(line_str)
+    rows.append(i_str)
 
-    print(line_str)
-    print(f"{'s[i]':^{cell_width}}|" + s_str.format(*preprocess(s_arr)))
+    rows.append(line_str)
+    rows.append(f"{'s[i]':^{cell_width}}|" + row_str.format(*preprocess(s_arr)))
 
     if print_numeric_representation:
-        print(line_str)
-        print(f"{'pi':^{cell_width}}|" + p_str.format(*preprocess(p_arr)))
+        rows.append(line_str)
+        rows.append(f"{'pi':^{cell_width}}|" + row_str.format(*preprocess(p_arr)))
 
-        print(line_str)
-        print(f"{'qi':^{cell_width}}|" + q_str.format(*preprocess(q_arr)))
+        rows.append(line_str)
+        rows.append(f"{'qi':^{cell_width}}|" + row_str.format(*preprocess(q_arr)))
 
-    print(line_str)
-    print(f"{'t[i]':^{cell_width}}|" + t_str.format(*preprocess(t_arr)))
+    rows.append(line_str)
+    rows.append(f"{'t[i]':^{cell_width}}|" + row_str.format(*preprocess(t_arr)))
 
-    print(line_str)
+    rows.append(line_str)
+
+    print("\n".join(rows))
 
     return "".join(t_arr)
 
@@ -148,11 +128,45 @@ def encypt(s, f):
         string: the encrypted string.
     """
 
-    f = function_wrapper(f)
+    shift = getattr(f, "shift", None)
+    if shift is not None:
+        k = shift % 26
+        return s.translate(
+            str.maketrans(ascii_lowercase, ascii_lowercase[k:] + ascii_lowercase[:k])
+        )
 
-    s_arr = list(s)
-    p_arr = [numeric_representation(c) for c in s_arr]
-    q_arr = [f(p_arr, i) for i in range(len(p_arr))]
-    t_arr = [character_representation(q) for q in q_arr]
+    sigma = getattr(f, "sigma", None)
+    if sigma is not None:
+        k = len(sigma)
+        return "".join([s[start + i] for start in range(0, len(s), k) for i in sigma])
 
-    return "".join(t_arr)
+    if s.isascii() and s.isalpha() and s.islower():
+        return encypt_fast(s, f)
+
+    if len(signature(f).parameters) == 1:
+        return "".join(
+            [chr(f(ord(c) - ord("a")) + ord("a")) if "a" <= c <= "z" else c for c in s]
+        )
+
+    p_arr = array("i", map(numeric_representation, s))
+    return "".join([chr(f(p_arr, i) + ord("a")) for i in range(len(p_arr))])
+
+
+def encypt_fast(s, f):
+    """Encrypt a string of lowercase letters using a given encryption function, without checking each character.
+
+    Validation is the caller's responsibility: every character of s must be between a and z.
+
+    Args:
+        s (string): the string to encrypt.
+        f (function): the encryption function (inputs and outputs a numeric representation).
+
+    Returns:
+        string: the encrypted string.
+    """
+    a = ord("a")
+    if len(signature(f).parameters) == 1:
+        return "".join([chr(f(ord(c) - a) + a) for c in s])
+
+    p_arr = array("i", [ord(c) - a for c in s])
+    return "".join([chr(f(p_arr, i) + a) for i in range(len(p_arr))])
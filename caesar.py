@@ -1,3 +1,7 @@
+from functools import lru_cache
+from string import ascii_lowercase, ascii_uppercase
+from typing import Callable
+
 from encryption import Encryption
 from process_funcs import (
     to_lower_case,
@@ -16,6 +20,34 @@ preprocess_groups = [numeric_representation]
 postprocess_groups = [character_representation]
 
 
+@lru_cache(maxsize=26)
+def make_translation_table(k: int) -> dict:
+    """Builds the translation table for a shift of k, cached since there are only 26 distinct shifts
+
+    Args:
+        k (int): the amount to shift the characters by, between 0 and 25
+
+    Returns:
+        dict: the str.translate table mapping each letter, upper or lower case, to its shifted lowercase letter
+    """
+    shifted = ascii_lowercase[k:] + ascii_lowercase[:k]
+    return str.maketrans(ascii_lowercase + ascii_uppercase, shifted + shifted)
+
+
+@lru_cache(maxsize=26)
+def make_shift_codes(k: int) -> dict:
+    """Builds the lookup of shifted numeric representations for a shift of k, cached since there are only 26 distinct shifts
+
+    Args:
+        k (int): the amount to shift the characters by, between 0 and 25
+
+    Returns:
+        dict: the shifted numeric representation of each letter's numeric representation, upper or lower case
+    """
+    codes = [ord(c) - 97 for c in ascii_lowercase + ascii_uppercase]
+    return {c: (c + k) % 26 for c in codes}
+
+
 class CaesarCipher(Encryption):
     """A Caesar Cipher class to perform shift ciphers. Inherits from the Encryption class"""
 
@@ -33,8 +65,25 @@ class CaesarCipher(Encryption):
             postprocess=postprocess_groups,
         )
 
+    @property
+    def shift(self) -> int:
+        """The amount to shift the characters by, the shift tables are rebuilt whenever it is set
+
+        Returns:
+            int: the shift
+        """
+        return self._shift
+
+    @shift.setter
+    def shift(self, shift: int) -> None:
+        self._shift = shift
+        self.translate_table = make_translation_table(shift % 26)
+        self.shift_codes = make_shift_codes(shift % 26)
+        self._encrypt_function = None
+        self.__dict__.pop("decryption_object", None)
+
     def _encrypt_group(self, c: int) -> int:
-        """Encrypts a single character
+        """Encrypts a single character by looking it up in the shifted codes, so non-letters map to themselves without a branch
 
         Args:
             c (int): the numeric representation of the character
@@ -42,9 +91,31 @@ class CaesarCipher(Encryption):
         Returns:
             int: the encrypted numeric representation of the character
         """
-        if c == -65:
-            return -65
-        return (c + self.shift) % 26
+        return self.shift_codes.get(c, c)
+
+    def _compile_encrypt(self) -> Callable[[any], any]:
+        """Builds the encrypt function, which translates ASCII plaintexts in a single pass with the default pipeline
+
+        Returns:
+            Callable[[any], any]: the specialized encrypt function
+        """
+        encrypt = super()._compile_encrypt()
+        if (
+            self.preprocess_raw_string != [to_lower_case]
+            or self.preprocess != [numeric_representation]
+            or self.postprocess != [character_representation]
+            or self.consolidator != "".join
+        ):
+            return encrypt
+
+        translate_table = self.translate_table
+
+        def translate_or_encrypt(plaintext: any) -> any:
+            if isinstance(plaintext, str) and plaintext.isascii():
+                return plaintext.translate(translate_table)
+            return encrypt(plaintext)
+
+        return translate_or_encrypt
 
     def print_encryption_table(
         self,
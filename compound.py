@@ -1,9 +1,29 @@
+from functools import lru_cache
 from typing import List, Callable, Tuple, Union
 
+from caesar import (
+    CaesarCipher,
+    preprocess_raw_string as caesar_preprocess_raw_string,
+    preprocess_groups as caesar_preprocess_groups,
+    postprocess_groups as caesar_postprocess_groups,
+)
 from encryption import Encryption
 from utils import list_and_space_output_processor, listify
 
 
+@lru_cache(maxsize=26)
+def make_merged_caesar_cipher(shift: int) -> CaesarCipher:
+    """Builds the Caesar cipher standing in for a merged run, cached since there are only 26 distinct shifts
+
+    Args:
+        shift (int): the summed shift of the run, between 0 and 25
+
+    Returns:
+        CaesarCipher: the merged Caesar cipher
+    """
+    return CaesarCipher(shift)
+
+
 class CompoundCipher(Encryption):
     """A cipher class to run multiple ciphers together"""
 
@@ -30,7 +50,7 @@ class CompoundCipher(Encryption):
         Returns:
             any: The encrypted text using the ciphers specified
         """
-        for cipher in self.ciphers:
+        for cipher in CompoundCipher.merge_caesar_ciphers(self.ciphers):
             group = cipher.encrypt(group)
         return group
 
@@ -91,6 +111,50 @@ class CompoundCipher(Encryption):
         decryption_ciphers.reverse()
         return CompoundCipher(decryption_ciphers)
 
+    @staticmethod
+    def is_mergeable_caesar_cipher(cipher: Encryption) -> bool:
+        """Checks whether a cipher is a plain Caesar cipher still running the default Caesar pipeline, so it can be merged with its neighbours
+
+        Args:
+            cipher (Encryption): the cipher to check
+
+        Returns:
+            bool: whether the cipher can be merged
+        """
+        return (
+            type(cipher) is CaesarCipher
+            and cipher.preprocess_raw_string == caesar_preprocess_raw_string
+            and cipher.preprocess == caesar_preprocess_groups
+            and cipher.postprocess == caesar_postprocess_groups
+            and cipher.group_by == 1
+            and cipher.consolidator == "".join
+        )
+
+    @staticmethod
+    def merge_caesar_ciphers(ciphers: List[Encryption]) -> List[Encryption]:
+        """Merges each run of consecutive mergeable Caesar ciphers into a single Caesar cipher shifting by the sum of their current shifts
+
+        Args:
+            ciphers (List[Encryption]): the ciphers to merge
+
+        Returns:
+            List[Encryption]: the ciphers with the Caesar runs merged
+        """
+        merged, run = [], []
+        for cipher in [*ciphers, None]:
+            if CompoundCipher.is_mergeable_caesar_cipher(cipher):
+                run.append(cipher)
+                continue
+            if len(run) > 1:
+                shift = sum(c.shift for c in run) % 26
+                merged.append(make_merged_caesar_cipher(shift))
+            else:
+                merged += run
+            run = []
+            if cipher is not None:
+                merged.append(cipher)
+        return merged
+
     def __repr__(self) -> str:
         """A string representation of the CompoundCipher object
 
@@ -1,11 +1,32 @@
+from functools import cached_property
 from typing import List, Callable, Tuple, Union
 
-from utils import list_and_space_output_processor, listify
+from utils import compose, list_and_space_output_processor, listify, scalar_chain
 
 
 class Encryption:
     """a general encryption class holding the method definitions"""
 
+    # the pipeline properties are backed by the underscored slots, __dict__ is kept
+    # for the cached decryption_object and for subclass attributes
+    __slots__ = (
+        "_preprocess_raw_string_funcs",
+        "_raw",
+        "_preprocess_funcs",
+        "_pre",
+        "_pre_vectorized",
+        "_postprocess_funcs",
+        "_post",
+        "_post_vectorized",
+        "_pipeline_key",
+        "_encrypt_function",
+        "group_by",
+        "_consolidator",
+        "is_decryption_object",
+        "params",
+        "__dict__",
+    )
+
     def __init__(
         self,
         preprocess_raw_string: List[Callable[[any], any]] = [],
@@ -28,10 +49,104 @@ class Encryption:
         self.postprocess = postprocess
         self.group_by = group_by
         self.consolidator = consolidator
-        self.decryption_object = None
         self.is_decryption_object = False
         self.params = {}
 
+    @property
+    def preprocess_raw_string(self) -> List[Callable[[any], any]]:
+        """The preprocess functions run on the raw string before grouping, composed into a single function when next used after they change
+
+        Returns:
+            List[Callable[[any], any]]: the raw string preprocess functions
+        """
+        return self._preprocess_raw_string_funcs
+
+    @preprocess_raw_string.setter
+    def preprocess_raw_string(self, funcs: List[Callable[[any], any]]) -> None:
+        self._preprocess_raw_string_funcs = funcs
+        self._pipeline_key = None
+
+    @property
+    def preprocess(self) -> List[Callable[[any], any]]:
+        """The preprocess functions run on each group, composed into a single function when next used after they change
+
+        Returns:
+            List[Callable[[any], any]]: the preprocess functions
+        """
+        return self._preprocess_funcs
+
+    @preprocess.setter
+    def preprocess(self, funcs: List[Callable[[any], any]]) -> None:
+        self._preprocess_funcs = funcs
+        self._pipeline_key = None
+
+    @property
+    def postprocess(self) -> List[Callable[[any], any]]:
+        """The postprocess functions run on each group, composed into a single function when next used after they change
+
+        Returns:
+            List[Callable[[any], any]]: the postprocess functions
+        """
+        return self._postprocess_funcs
+
+    @postprocess.setter
+    def postprocess(self, funcs: List[Callable[[any], any]]) -> None:
+        self._postprocess_funcs = funcs
+        self._pipeline_key = None
+
+    @property
+    def consolidator(self) -> Callable[[List[any]], any]:
+        """The function consolidating the encrypted groups, the compiled encrypt is rebuilt whenever it is set
+
+        Returns:
+            Callable[[List[any]], any]: the consolidator
+        """
+        return self._consolidator
+
+    @consolidator.setter
+    def consolidator(self, consolidator: Callable[[List[any]], any]) -> None:
+        self._consolidator = consolidator
+        self._encrypt_function = None
+
+    def _sync(self) -> None:
+        """Recomposes the pipeline functions and drops the compiled encrypt when a pipeline list was set or changed in place since they were last composed"""
+        funcs = [
+            self._preprocess_raw_string_funcs,
+            self._preprocess_funcs,
+            self._postprocess_funcs,
+        ]
+        if funcs == self._pipeline_key:
+            return
+        # copies, so changing a list in place is seen on the next call
+        raw, pre, post = self._pipeline_key = [list(f) for f in funcs]
+        self._raw = compose(raw)
+        # the groups are never lists, so a leading listified function is called directly
+        self._pre = compose(scalar_chain(pre))
+        self._pre_vectorized = all(hasattr(f, "vectorized") for f in pre)
+        self._post = compose(post)
+        self._post_vectorized = all(hasattr(f, "vectorized") for f in post)
+        self._encrypt_function = None
+
+    @staticmethod
+    def _apply_stage(grouped_text: List[any], f: Callable[[any], any]) -> List[any]:
+        """Applies a single stage function to every group, passing the whole list to the function's vectorized form when it has one and the groups are not lists themselves
+
+        Args:
+            grouped_text (List[any]): the grouped text to be processed
+            f (Callable[[any], any]): the stage function
+
+        Returns:
+            List[any]: the processed grouped text
+        """
+        vectorized = getattr(f, "vectorized", None)
+        if (
+            vectorized is not None
+            and grouped_text
+            and not isinstance(grouped_text[0], list)
+        ):
+            return vectorized(grouped_text)
+        return [f(group) for group in grouped_text]
+
     def _preprocess_raw_string(self, raw_string: any) -> any:
         """Runs the preprocess functions on the raw string
 
@@ -41,9 +156,8 @@ class Encryption:
         Returns:
             any: the processed raw string
         """
-        for f in self.preprocess_raw_string:
-            raw_string = f(raw_string)
-        return raw_string
+        self._sync()
+        return self._raw(raw_string)
 
     def _group_by(self, text: any) -> List[str]:
         """Groups the text by the group_by attribute
@@ -54,13 +168,41 @@ class Encryption:
         Returns:
             List[any]: the text grouped in groups of self.group_by
         """
+        if type(text) is not str:
+            text = str(text)
         if self.group_by < 0:
-            group_by = len(text)
-        else:
-            group_by = self.group_by
-        text = str(text)
+            return [text]
+        if self.group_by == 1:
+            return list(text)
+        group_by = self.group_by
         return [text[i : i + group_by] for i in range(0, len(text), group_by)]
 
+    @property
+    def bytes_mode(self) -> bool:
+        """Whether encrypt groups the ASCII encoded bytes of the text rather than the string: the raw string pipeline ends in an ASCII-only function and there are no preprocess stages, so the groups go straight to _encrypt
+
+        Returns:
+            bool: whether encrypt groups bytes
+        """
+        funcs = self.preprocess_raw_string
+        ascii_only = bool(funcs) and getattr(funcs[-1], "ascii_only", False)
+        return ascii_only and not self.preprocess
+
+    def _group_bytes(self, text: str) -> List[bytes]:
+        """Groups the ASCII encoded bytes of the text by the group_by attribute, slicing bytes skips the maximum code point scan a str slice does
+
+        Args:
+            text (str): the ASCII text to be grouped
+
+        Returns:
+            List[bytes]: the encoded text grouped in groups of self.group_by
+        """
+        b = text.encode("ascii")
+        if self.group_by < 0:
+            return [b]
+        group_by = self.group_by
+        return [b[i : i + group_by] for i in range(0, len(b), group_by)]
+
     def _preprocess(self, grouped_text: List[str]) -> List[any]:
         """Runs the preprocess functions on the grouped text
 
@@ -70,9 +212,13 @@ class Encryption:
         Returns:
             List[any]: the processed grouped text
         """
-        for f in self.preprocess:
-            grouped_text = [f(group) for group in grouped_text]
-        return grouped_text
+        self._sync()
+        if self._pre_vectorized:
+            for f in self.preprocess:
+                grouped_text = self._apply_stage(grouped_text, f)
+            return grouped_text
+        pre = self._pre
+        return [pre(group) for group in grouped_text]
 
     def _encrypt_group(self, group: any) -> any:
         """Encrypts a single group
@@ -108,9 +254,13 @@ class Encryption:
         Returns:
             List[any]: the processed grouped text
         """
-        for f in self.postprocess:
-            grouped_text = [f(group) for group in grouped_text]
-        return grouped_text
+        self._sync()
+        if self._post_vectorized:
+            for f in self.postprocess:
+                grouped_text = self._apply_stage(grouped_text, f)
+            return grouped_text
+        post = self._post
+        return [post(group) for group in grouped_text]
 
     def encrypt(self, plaintext: any) -> any:
         """Encrypts the plaintext
@@ -125,13 +275,51 @@ class Encryption:
             any: the encrypted ciphertext
         """
 
-        temp = self._preprocess_raw_string(plaintext)
-        temp = self._group_by(temp)
-        temp = self._preprocess(temp)
-        temp = self._encrypt(temp)
-        temp = self._postprocess(temp)
-        temp = self.consolidator(temp)
-        return temp
+        self._sync()
+        encrypt_function = self._encrypt_function
+        if encrypt_function is None:
+            encrypt_function = self._encrypt_function = self._compile_encrypt()
+        return encrypt_function(plaintext)
+
+    def _compile_encrypt(self) -> Callable[[any], any]:
+        """Builds an encrypt function with every stage of the current pipeline bound up front, rebuilt whenever preprocess_raw_string, preprocess or postprocess is set or changed in place, or the consolidator is set
+
+        Returns:
+            Callable[[any], any]: the specialized encrypt function
+        """
+        group_by = self._group_bytes if self.bytes_mode else self._group_by
+        # with no raw string functions this is group_by itself
+        preprocess_and_group = compose([*self.preprocess_raw_string, group_by])
+        preprocess_and_group_str = compose(
+            [*scalar_chain(self.preprocess_raw_string), group_by]
+        )
+        consolidator = self.consolidator
+
+        if type(self)._encrypt is Encryption._encrypt:
+            pipeline = compose(
+                [*scalar_chain(self.preprocess), self._encrypt_group, *self.postprocess]
+            )
+
+            def encrypt_groups(grouped_text: List[any]) -> List[any]:
+                return [pipeline(group) for group in grouped_text]
+
+        else:
+            # the subclass encrypts all the groups at once, so keep the stages separate
+            preprocess, encrypt_all, postprocess = (
+                self._preprocess,
+                self._encrypt,
+                self._postprocess,
+            )
+
+            def encrypt_groups(grouped_text: List[any]) -> List[any]:
+                return postprocess(encrypt_all(preprocess(grouped_text)))
+
+        def encrypt(plaintext: any) -> any:
+            if type(plaintext) is str:
+                return consolidator(encrypt_groups(preprocess_and_group_str(plaintext)))
+            return consolidator(encrypt_groups(preprocess_and_group(plaintext)))
+
+        return encrypt
 
     def decrypt(self, ciphertext: any) -> any:
         """Decrypts the ciphertext
@@ -142,7 +330,7 @@ class Encryption:
         Returns:
             any: the decrypted plaintext
         """
-        return self.make_decryption_object().encrypt(ciphertext)
+        return self.decryption_object.encrypt(ciphertext)
 
     def make_encryption_table(
         self,
@@ -186,7 +374,7 @@ class Encryption:
         add_line("groupings", temp)
 
         for f in self.preprocess:
-            temp = [f(group) for group in temp]
+            temp = self._apply_stage(temp, f)
             if show_steps:
                 add_line(f.__name__, temp)
 
@@ -198,7 +386,7 @@ class Encryption:
                 add_line("encrypt", temp)
 
         for f in self.postprocess:
-            temp = [f(group) for group in temp]
+            temp = self._apply_stage(temp, f)
             if show_steps:
                 add_line(f.__name__, temp)
 
@@ -222,36 +410,31 @@ class Encryption:
             cell_width (int, optional): The minimum cell width. Defaults to 5.
         """
         
-        name_width = max(len(name) for name, _ in table_lines) + 2
-
-        max_cell_in_line = lambda line: len(max(line[1], key=len))
-        cell_width = max(
-            cell_width,
-            max_cell_in_line(max(table_lines, key=max_cell_in_line)) + 2,
-        )
+        name_width = max(map(len, [name for name, _ in table_lines]), default=0) + 2
+        cells = [
+            cell for _, line in table_lines if isinstance(line, list) for cell in line
+        ]
+        cell_width = max(cell_width, max(map(len, cells), default=0) + 2)
 
         line_length = name_width + 2 + (cell_width + 1) * groupings
         row_space = line_length - name_width - 3
 
         line_str = "-" * line_length
 
-        format_array = ["{:^" + str(cell_width) + "}"] * groupings
+        format_row = "|".join(["{:^" + str(cell_width) + "}"] * groupings).format
 
+        rows = []
         for name, line in table_lines:
-            print(line_str)
+            rows.append(line_str)
             if isinstance(line, list):
                 if len(line) != groupings:
                     line += [""] * (groupings - len(line))
-                print(
-                    f"|{name:^{name_width}}|"
-                    + "|".join(format_array).format(*line)
-                    + "|"
-                )
+                rows.append(f"|{name:^{name_width}}|" + format_row(*line) + "|")
             else:
-                print(f"|{name:^{name_width}}|{line:^{row_space}}|")
+                rows.append(f"|{name:^{name_width}}|{line:^{row_space}}|")
+        rows.append(line_str)
 
-        print(line_str)
-        print()
+        print("\n".join(rows) + "\n")
 
     def print_encryption_table(
         self,
@@ -273,8 +456,7 @@ class Encryption:
         """
 
         prefix = "De" if self.is_decryption_object else "En"
-        print(f"{prefix}cryption Table - " + self.__repr__() + f"({plaintext}):")
-        prefix = prefix.lower()
+        print(f"{prefix}cryption Table - {self!r}({plaintext}):")
 
         table_lines, ciphertext, groupings = self.make_encryption_table(
             plaintext, output_processor, show_steps
@@ -302,7 +484,7 @@ class Encryption:
         Returns:
             any: the decrypted plaintext
         """
-        return self.make_decryption_object().print_encryption_table(
+        return self.decryption_object.print_encryption_table(
             ciphertext, cell_width, output_processor, show_steps
         )
 
@@ -314,15 +496,23 @@ class Encryption:
         """
         raise NotImplementedError
 
+    @cached_property
+    def decryption_object(self) -> "Encryption":
+        """The decryption object of the current object, created on first access and then stored on the instance
+
+        Returns:
+            Encryption: the decryption object
+        """
+        decryption_object = self._make_decryption_object()
+        decryption_object.is_decryption_object = True
+        return decryption_object
+
     def make_decryption_object(self) -> "Encryption":
         """Creates a decryption object from the current object
 
         Returns:
             Encryption: the decryption object
         """
-        if self.decryption_object is None:
-            self.decryption_object = self._make_decryption_object()
-            self.decryption_object.is_decryption_object = True
         return self.decryption_object
 
     def __call__(self, plaintext: any) -> any:
@@ -1,3 +1,5 @@
+from typing import List, Union
+
 from utils import listify
 
 
@@ -14,32 +16,42 @@ def to_lower_case(s: str) -> str:
     return s.lower()
 
 
-@listify
-def numeric_representation(c: str) -> int:
-    """Converts a character to a numeric representation
+def numeric_representation(c: Union[str, List[str]]) -> Union[int, List[int]]:
+    """Converts a character (or list of characters) to a numeric representation.
+    Lists are converted in one comprehension over map(ord, ...) rather than a function call per character
 
     Args:
-        c (str): the character to convert to a numeric representation
+        c (Union[str, List[str]]): the character(s) to convert to a numeric representation
 
     Returns:
-        int: the numeric representation of the character
+        Union[int, List[int]]: the numeric representation of the character(s)
     """
+    if isinstance(c, list):
+        return [o - 97 for o in map(ord, c)]
     return ord(c) - 97
 
 
-@listify
-def character_representation(c: int) -> str:
-    """Converts a numeric representation to a character
+numeric_representation.vectorized = numeric_representation
+
+
+def character_representation(c: Union[int, List[int]]) -> Union[str, List[str]]:
+    """Converts a numeric representation (or list of them) to a character.
+    Lists are converted in one comprehension rather than a function call per element
 
     Args:
-        c (int): the numeric representation to convert to a character
+        c (Union[int, List[int]]): the numeric representation(s) to convert to a character
 
     Returns:
-        str: the character representation of the numeric representation
+        Union[str, List[str]]: the character representation of the numeric representation(s)
     """
+    if isinstance(c, list):
+        return [chr(n + 97) for n in c]
     return chr(c + 97)
 
 
+character_representation.vectorized = character_representation
+
+
 @listify
 def pad_numeric_representation(c: int) -> str:
     """Pads a numeric representation to an even number of characters
@@ -54,6 +66,21 @@ def pad_numeric_representation(c: int) -> str:
     return s.zfill(len(s) + 1) if len(s) % 2 == 1 else s
 
 
+class _RSAFormatTable(dict):
+    """A str.translate table from a code point to its padded numeric representation, filled in on first use of each character"""
+
+    def __missing__(self, key: int) -> str:
+        value = self[key] = pad_numeric_representation(key - 97)
+        return value
+
+
+_RSA_FORMAT_TABLE = _RSAFormatTable()
+
+# a plain dict is looked up faster by str.translate than a dict subclass, so ASCII
+# text, the usual case, goes through a table filled up front
+_ASCII_RSA_FORMAT_TABLE = {i: pad_numeric_representation(i - 97) for i in range(128)}
+
+
 @listify
 def convert_to_rsa_format(s: str) -> str:
     """Converts a string to the RSA format
@@ -64,7 +91,12 @@ def convert_to_rsa_format(s: str) -> str:
     Returns:
         str: the string in the RSA format
     """
-    return "".join(pad_numeric_representation(numeric_representation(c)) for c in s)
+    if s.isascii():
+        return s.translate(_ASCII_RSA_FORMAT_TABLE)
+    return s.translate(_RSA_FORMAT_TABLE)
+
+
+convert_to_rsa_format.ascii_only = True
 
 
 @listify
@@ -80,6 +112,9 @@ def remove_spaces(s: str) -> str:
     return s.replace(" ", "")
 
 
+_DIGIT_PAIR_TABLE = {f"{i:02d}": character_representation(i) for i in range(100)}
+
+
 @listify
 def convert_each_2_digits_to_char(s: str) -> str:
     """Converts each two digits to a character
@@ -90,6 +125,16 @@ def convert_each_2_digits_to_char(s: str) -> str:
     Returns:
         str: the string converted to a character
     """
+    if len(s) % 2 == 0:
+        # pair the digits up with zip over one iterator and look every pair up in C
+        digits = iter(s)
+        try:
+            return "".join(
+                map(_DIGIT_PAIR_TABLE.__getitem__, map("".join, zip(digits, digits)))
+            )
+        except KeyError:
+            pass
+    pairs = [s[i : i + 2] for i in range(0, len(s), 2)]
     return "".join(
-        character_representation(int(s[i : i + 2])) for i in range(0, len(s), 2)
+        [_DIGIT_PAIR_TABLE.get(p) or character_representation(int(p)) for p in pairs]
     )
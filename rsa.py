@@ -1,3 +1,6 @@
+from functools import lru_cache
+from itertools import repeat
+from math import gcd, isqrt, log10, prod
 from typing import List, Tuple
 
 from encryption import Encryption
@@ -14,15 +17,21 @@ preprocess_raw_string = [to_lower_case, remove_spaces, convert_to_rsa_format]
 preprocess_raw_string_decrypt = []
 
 # Preprocess Characters
-preprocess_groups = [int]
+preprocess_groups = []  # groups are parsed with int inside _encrypt
 
 # Post Process Characters
-postprocess_groups = [pad_numeric_representation]
+postprocess_groups = [pad_numeric_representation]  # padded as one list through .vectorized
 postprocess_groups_decrypt = [pad_numeric_representation, convert_each_2_digits_to_char]
 
+# Small primes stripped by trial division before falling back to Pollard's rho
+_SMALL_PRIMES = tuple(p for p in range(2, 200) if all(p % d for d in range(2, p)))
+_SMALL_PRIMES_PRODUCT = prod(_SMALL_PRIMES)
+
 class RSA(Encryption):
     """An RSA Cipher class to perform RSA encryption. Inherits from the Encryption class"""
 
+    __slots__ = ("n", "e", "p", "q", "phi", "d", "crt", "crt_key")
+
     def __init__(self, n: int, e: int, p: int=-1, q: int=-1, calculate_p_q: bool=False) -> None:
         """Initializes the RSA Cipher class
 
@@ -36,6 +45,8 @@ class RSA(Encryption):
         
         self.n = n
         self.e = e
+        # (p, q, d mod p-1, d mod q-1, q^-1 mod p), set on decryption objects that know p and q
+        self.crt = None
 
         if calculate_p_q and p == -1 and q == -1:
             p, q = RSA.calculate_p_and_q(n, e)
@@ -49,16 +60,61 @@ class RSA(Encryption):
             group_by=RSA.calculate_group_by(n),
         )
 
-    def _encrypt_group(self, group: int) -> int:
-        """Encrypts a group of characters represented by an integer
+    def _group_by(self, text: any) -> List[str]:
+        """Groups the digits into chunks of group_by digits, the group size is always even so there is no whole-text or per-character branch
+
+        Args:
+            text (any): the digits to be grouped, converted with str unless they already are a str (the decryption object gets the caller's input as is)
+
+        Returns:
+            List[str]: the digit string grouped in groups of self.group_by
+        """
+        if type(text) is not str:
+            text = str(text)
+        group_by = self.group_by
+        return [text[i : i + group_by] for i in range(0, len(text), group_by)]
+
+    def _encrypt_group(self, group: str) -> int:
+        """Encrypts a group of characters represented by a string of digits
 
         Args:
-            group (int): The group of characters to encrypt represented by an integer
+            group (str): The group of characters to encrypt represented by a string of digits
 
         Returns:
             int: The encrypted group of characters represented by an integer
         """        
-        return group ** self.e % self.n
+        if self.crt is not None:
+            return self._crt_pow(int(group))
+        return pow(int(group), self.e, self.n)
+
+    def _crt_pow(self, c: int) -> int:
+        """Raises c to the decryption exponent with the Chinese remainder theorem: two half-width pows mod p and q recombined with Garner's formula
+
+        Args:
+            c (int): The encrypted group represented by an integer
+
+        Returns:
+            int: The decrypted group represented by an integer
+        """
+        p, q, dp, dq, qinv = self.crt
+        m2 = pow(c, dq, q)
+        return m2 + (qinv * (pow(c, dp, p) - m2)) % p * q
+
+    def _encrypt(self, grouped_text: List[str]) -> List[int]:
+        """Parses and encrypts all the groups at once with the builtin modular pow rather than a method call per group, the decryption object runs the same batch with d
+
+        Args:
+            grouped_text (List[str]): The groups of characters to encrypt represented by strings of digits
+
+        Returns:
+            List[int]: The encrypted groups of characters represented by integers
+        """
+        # the three argument pow already runs a windowed square and multiply in C over
+        # n-sized integers, a Montgomery ladder written in Python would only add bytecode
+        if self.crt is not None:
+            return list(map(self._crt_pow, map(int, grouped_text)))
+        # map drives the parse and the pow from C, with no bytecode per group
+        return list(map(pow, map(int, grouped_text), repeat(self.e), repeat(self.n)))
 
     def _make_decryption_object(self) -> "RSA":
         """Creates a new RSA object that is the decryption object
@@ -69,6 +125,7 @@ class RSA(Encryption):
         if self.p == -1 or self.q == -1:
             raise ValueError("Cannot create decryption object without p and q")
         temp = RSA(self.n, self.d)
+        temp.crt = self.crt_key
         temp.preprocess_raw_string = preprocess_raw_string_decrypt
         temp.postprocess = postprocess_groups_decrypt
         return temp
@@ -82,15 +139,23 @@ class RSA(Encryption):
         """        
         self.p = p
         self.q = q
+        self.crt_key = None
 
         if self.p != -1 and self.q != -1:
             if self.n != self.p * self.q:
                 raise ValueError("n must equal p * q")
             self.phi = (self.p - 1) * (self.q - 1)
-            self.d = RSA.calculate_d(self.e, (self.p - 1) * (self.q - 1))
+            self.d = RSA.calculate_d(self.e, self.phi)
             if self.e < 1 or self.e >= self.phi:
                 raise ValueError("e must be between 1 and phi")
 
+            # the CRT decryption constants only depend on the key, so they are kept with it,
+            # a prime of 2 would reduce its exponent to 0 and is left to the plain pow
+            qinv = RSA.calculate_d(q, p)
+            if p > 2 and q > 2 and p != q and qinv != -1:
+                d = self.d
+                self.crt_key = (p, q, d % (p - 1), d % (q - 1), qinv)
+
     def __repr__(self) -> str:
         """Returns a string representation of the RSA object
 
@@ -102,22 +167,27 @@ class RSA(Encryption):
         return super().__repr__() + f"[n={self.n}, e={self.e}]"
 
     @staticmethod
+    @lru_cache(maxsize=None)
     def calculate_group_by(n: int) -> int:
-        """Calculates the group by value for the RSA cipher
+        """Calculates the group by value for the RSA cipher in closed form: twice the number of times 25 has to be extended to 2525...25 before it reaches n
 
         Args:
             n (int): the RSA modulus
 
         Returns:
             int: the group by value
-        """              
-        s = 25
-        c = 0
-        while int(s) < n:
-            s *= 100
-            s += 25
-            c += 1
-        return c * 2
+        """
+        if n <= 25:
+            return 0
+        # 25 * (100^(c+1) - 1) / 99 >= n solves to 100^(c+1) > ceil(99n / 25), so c + 1 is
+        # the number of base 100 digits of x, estimated from the bit length and corrected
+        x = -(-99 * n // 25)
+        digits = int(x.bit_length() * log10(2) / 2) + 1
+        if 100 ** (digits - 1) > x:
+            digits -= 1
+        elif 100**digits <= x:
+            digits += 1
+        return (digits - 1) * 2
 
     @staticmethod
     def calculate_d(e: int, phi: int) -> int:
@@ -137,18 +207,24 @@ class RSA(Encryption):
 
     @staticmethod
     def calculate_d_slow(e: int, phi: int) -> int:
-        """Calculates the d value for the RSA cipher
+        """Calculates the d value for the RSA cipher with the iterative extended Euclidean algorithm
 
         Args:
             e (int): the RSA public key
             phi (int): the RSA totient
 
         Returns:
-            int: the d value
+            int: the d value, -1 if e has no inverse mod phi
         """
-        for d in range(phi):
-            if (e * d) % phi == 1:
-                return d
+        old_r, r = e % phi, phi
+        old_x, x = 1, 0
+        while r:
+            quotient = old_r // r
+            old_r, r = r, old_r - quotient * r
+            old_x, x = x, old_x - quotient * x
+        if old_r != 1:
+            return -1
+        return old_x % phi
 
     @staticmethod
     def calculate_p_and_q(n: int, e: int) -> Tuple[int]:
@@ -168,14 +244,100 @@ class RSA(Encryption):
         if e >= n:
             raise ValueError("e must be less than n")
 
-        for p in range(2, n):
-            if (n % p) == 0:
-                q = n // p
-                if RSA.calculate_d(e, (p - 1) * (q - 1)) != -1:
-                    return p, q
+        p = RSA.smallest_prime_factor(n)
+        if p != n:
+            q = n // p
+            if RSA.calculate_d(e, (p - 1) * (q - 1)) != -1:
+                return p, q
 
         return -1, -1
 
+    @staticmethod
+    def smallest_prime_factor(n: int) -> int:
+        """Finds the smallest prime factor of n by trial division over the small primes (which catches even n first), a perfect square check, then by splitting the rest with Pollard's rho
+
+        Args:
+            n (int): The number to factor, greater than 1
+
+        Returns:
+            int: The smallest prime factor of n, n itself when n is prime
+        """
+        # one gcd against the product of the small primes tells whether any divides n
+        shared = gcd(n, _SMALL_PRIMES_PRODUCT)
+        if shared > 1:
+            for p in _SMALL_PRIMES:
+                if shared % p == 0:
+                    return p
+        if RSA._is_probable_prime(n):
+            return n
+        r = isqrt(n)
+        if r * r == n:
+            return RSA.smallest_prime_factor(r)
+        d = RSA._pollard_rho(n)
+        return min(RSA.smallest_prime_factor(d), RSA.smallest_prime_factor(n // d))
+
+    @staticmethod
+    def _is_probable_prime(n: int) -> bool:
+        """Miller-Rabin test over the first thirteen prime bases, deterministic below 3.3 * 10^24
+
+        Args:
+            n (int): The number to test, with no factors among the small primes
+
+        Returns:
+            bool: Whether n is prime
+        """
+        if n < _SMALL_PRIMES[-1] ** 2:
+            return n > 1
+        d, r = n - 1, 0
+        while d % 2 == 0:
+            d //= 2
+            r += 1
+        for a in _SMALL_PRIMES[:13]:
+            x = pow(a, d, n)
+            if x == 1 or x == n - 1:
+                continue
+            for _ in range(r - 1):
+                x = x * x % n
+                if x == n - 1:
+                    break
+            else:
+                return False
+        return True
+
+    @staticmethod
+    def _pollard_rho(n: int) -> int:
+        """Finds a nontrivial factor of an odd composite n with Brent's variant of Pollard's rho, taking one gcd per batch of 128 steps
+
+        Args:
+            n (int): The odd composite number to split
+
+        Returns:
+            int: A factor of n strictly between 1 and n
+        """
+        for c in range(1, n):
+            y, r, m, g, product = 2, 1, 128, 1, 1
+            while g == 1:
+                x = y
+                for _ in range(r):
+                    y = (y * y + c) % n
+                k = 0
+                while k < r and g == 1:
+                    saved_y = y
+                    for _ in range(min(m, r - k)):
+                        y = (y * y + c) % n
+                        product = product * abs(x - y) % n
+                    g = gcd(product, n)
+                    k += m
+                r *= 2
+            if g == n:
+                # the batch overshot, so step back through it one gcd at a time
+                g = 1
+                while g == 1:
+                    saved_y = (saved_y * saved_y + c) % n
+                    g = gcd(abs(x - saved_y), n)
+            if g != n:
+                return g
+
     @staticmethod
     def make_RSA_object(p: int, q: int, e: int = 65537) -> "RSA":
         """Creates a new RSA object with a public key
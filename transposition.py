@@ -1,3 +1,4 @@
+from operator import itemgetter
 from typing import List, Callable, Union
 
 from encryption import Encryption
@@ -15,7 +16,7 @@ class TranspositionCipher(Encryption):
             sigma (Union[List[int], Callable[[int], int]]): The function or list map to use as the transposition function in the cipher.
             n (int, optional): The grouping number (length of the set to permute). Defaults to len(sigma).
         """
-        if type(sigma) == Callable[[int], int]:
+        if callable(sigma):
             if n == -1:
                 raise Exception("If sigma is a function, n must be specified.")
             else:
@@ -39,8 +40,55 @@ class TranspositionCipher(Encryption):
             return s + "?" * (n - (len(s) - 1) % n - 1)
 
         self.sigma = sigma
+        # character i moves to position sigma[i], so position j gathers from inverse[j]
+        inverse = [0] * n
+        for i, s in enumerate(sigma):
+            inverse[s] = i
+        self._inverse = tuple(inverse)
+        self._gather = itemgetter(*inverse)
+        self._pad = pad
         super().__init__(preprocess_raw_string=[pad], group_by=n)
 
+    def _compile_encrypt(self) -> Callable[[any], any]:
+        """Builds the encrypt function, which permutes ASCII plaintexts a column at a time with the default pipeline
+
+        Returns:
+            Callable[[any], any]: the specialized encrypt function
+        """
+        encrypt = super()._compile_encrypt()
+        if (
+            self.preprocess_raw_string != [self._pad]
+            or self.preprocess
+            or self.postprocess
+            or self.consolidator != "".join
+        ):
+            return encrypt
+
+        pad = self._pad
+
+        def permute_columns_or_encrypt(plaintext: any) -> any:
+            if isinstance(plaintext, str) and plaintext.isascii():
+                return self._permute_columns(pad(plaintext))
+            return encrypt(plaintext)
+
+        return permute_columns_or_encrypt
+
+    def _permute_columns(self, text: str) -> str:
+        """Encrypts a padded ASCII text at once: position j of every group is the extended slice starting at j, filled from the slice starting at inverse[j]
+
+        Args:
+            text (str): The padded ASCII text to encrypt
+
+        Returns:
+            str: the encrypted text
+        """
+        b = text.encode("ascii")
+        out = bytearray(len(b))
+        n = self.group_by
+        for j, i in enumerate(self._inverse):
+            out[j::n] = b[i::n]
+        return out.decode("ascii")
+
     def _encrypt_group(self, group: str) -> any:
         """Encrypts a group of characters.
 
@@ -50,10 +98,7 @@ class TranspositionCipher(Encryption):
         Returns:
             any: [description]
         """
-        s = [""] * self.group_by
-        for i in range(self.group_by):
-            s[self.sigma[i]] = group[i]
-        return "".join(s)
+        return "".join(self._gather(group))
 
     def _make_decryption_object(self) -> "TranspositionCipher":
         """Creates a decryption object using sigma as the inverse of the encryption object's sigma.
@@ -61,9 +106,7 @@ class TranspositionCipher(Encryption):
         Returns:
             TranspositionCipher: the decryption object.
         """
-        return TranspositionCipher(
-            [self.sigma.index(i) for i in range(self.group_by)], self.group_by
-        )
+        return TranspositionCipher(list(self._inverse), self.group_by)
 
     def __repr__(self) -> str:
         s = ""
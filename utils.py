@@ -1,3 +1,4 @@
+from functools import lru_cache
 from typing import List, Callable, Union
 
 def listify(func: Callable[[any], any]) -> Callable[[List[any]], List[any]]:
@@ -7,16 +8,92 @@ def listify(func: Callable[[any], any]) -> Callable[[List[any]], List[any]]:
         func (Callable[[any], any]): the function to wrap
 
     Returns:
-        Callable[[List[any]], List[any]]: the wrapped function that can handle lists of objects
+        Callable[[List[any]], List[any]]: the wrapped function that can handle lists of objects, with the list-only function as its vectorized form and the original function as its scalar form
     """    
+    def listed(lst: List[any]) -> List[any]:
+        return [func(elem) for elem in lst]
     def wrapper(lst: Union[List[any], any]) -> Union[List[any], any]:
-        if isinstance(lst, list):
+        # a plain type check, singledispatch costs a registry lookup and a call per use
+        if type(lst) is list:
             return [func(elem) for elem in lst]
-        else:
-            return func(lst)
-    wrapper.__name__ = func.__name__
+        return func(lst)
+    wrapper.__name__ = listed.__name__ = func.__name__
+    wrapper.vectorized = listed
+    wrapper.scalar = func
+    wrapper.listified = True
     return wrapper
 
+def scalar_chain(funcs: List[Callable[[any], any]]) -> List[Callable[[any], any]]:
+    """Replaces the first function of a chain with its scalar form when it is listified, for chains whose input is known not to be a list.
+
+    Only the first function is unwrapped, a listified function may well return a list, so the input type of the rest of the chain is not known.
+
+    Args:
+        funcs (List[Callable[[any], any]]): the functions of the chain, applied first to last
+
+    Returns:
+        List[Callable[[any], any]]: the chain with its first function unwrapped
+    """
+    funcs = list(funcs)
+    if funcs and getattr(funcs[0], "listified", False):
+        funcs[0] = funcs[0].scalar
+    return funcs
+
+def _identity(x: any) -> any:
+    """Returns its argument, the composition of no functions.
+
+    Args:
+        x (any): the argument
+
+    Returns:
+        any: the argument
+    """
+    return x
+
+@lru_cache(maxsize=None)
+def _make_composer(arity: int) -> Callable[..., Callable[[any], any]]:
+    """Generates the factory composing a given number of functions, cached so the code is only generated once per arity.
+
+    Args:
+        arity (int): the number of functions to compose
+
+    Returns:
+        Callable[..., Callable[[any], any]]: a factory taking the functions, first to last, and returning their composition
+    """
+    names = [f"f{i}" for i in range(arity)]
+    call = "x"
+    for name in names:
+        call = f"{name}({call})"
+    namespace = {}
+    exec(
+        f"def composer({', '.join(names)}):\n"
+        f"    def composed(x):\n"
+        f"        return {call}\n"
+        f"    return composed\n",
+        namespace,
+    )
+    return namespace["composer"]
+
+def compose(funcs: List[Callable[[any], any]]) -> Callable[[any], any]:
+    """Composes a list of functions into a single function that applies them in order.
+
+    The function is generated as one nested call expression, f2(f1(f0(x))), so calling it does not loop over the list.
+
+    Args:
+        funcs (List[Callable[[any], any]]): the functions to compose, applied first to last
+
+    Returns:
+        Callable[[any], any]: the composed function
+    """
+    funcs = tuple(funcs)
+    if not funcs:
+        return _identity
+    if len(funcs) == 1:
+        return funcs[0]
+    return _make_composer(len(funcs))(*funcs)
+
+_SPACE = {-65: " "}
+
 def list_and_space_output_processor(x: any) -> str:
     """Output processor to handle -65 as space and lists of objects.
 
@@ -26,9 +103,9 @@ def list_and_space_output_processor(x: any) -> str:
     Returns:
         str: the processed display string
     """
-    if isinstance(x, list):
+    t = type(x)
+    if t is list:
         return ", ".join(map(list_and_space_output_processor, x))
-    elif x == -65:
-        return " "
-    else:
-        return str(x)
\ No newline at end of file
+    if t is int:
+        return _SPACE.get(x) or str(x)
+    return " " if x == -65 else str(x)
\ No newline at end of file
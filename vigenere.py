@@ -1,4 +1,7 @@
-from typing import List
+from functools import lru_cache
+from itertools import cycle
+from string import ascii_lowercase
+from typing import Callable, List, Tuple
 
 from encryption import Encryption
 from process_funcs import (
@@ -18,6 +21,47 @@ preprocess_groups = [list, numeric_representation]
 postprocess_groups = [character_representation, "".join]
 
 
+@lru_cache(maxsize=26)
+def make_shift_table(k: int) -> bytes:
+    """Makes the bytes.translate table that shifts lowercase letters by k
+
+    Args:
+        k (int): The shift, between 0 and 25
+
+    Returns:
+        bytes: the translation table
+    """
+    shifted = ascii_lowercase[k:] + ascii_lowercase[:k]
+    return bytes.maketrans(ascii_lowercase.encode(), shifted.encode())
+
+
+@lru_cache(maxsize=26)
+def make_shift_row(k: int) -> dict:
+    """Makes the lookup row of a key shift over the numeric representations of ASCII characters
+
+    Args:
+        k (int): The shift, between 0 and 25
+
+    Returns:
+        dict: the shifted numeric representation of each ASCII one, -65 (space) mapping to itself
+    """
+    return {c: -65 if c == -65 else (c + k) % 26 for c in range(-97, 31)}
+
+
+@lru_cache(maxsize=128)
+def parse_key(key: str) -> Tuple[Tuple[int, ...], Tuple[dict, ...]]:
+    """Parses a key into its numeric representations and their shift rows, cached so ciphers sharing a key only parse it once
+
+    Args:
+        key (str): The key to parse
+
+    Returns:
+        Tuple[Tuple[int, ...], Tuple[dict, ...]]: the numeric representation of each key character and its shift row
+    """
+    shifts = tuple(numeric_representation(list(key)))
+    return shifts, tuple(make_shift_row(k % 26) for k in shifts)
+
+
 class VigenereCipher(Encryption):
     """A Vigenere Cipher class to perform shift ciphers. Inherits from the Encryption class"""
 
@@ -27,8 +71,38 @@ class VigenereCipher(Encryption):
         Args:
             key (str): The key to use for the encryption
         """
+        self._setup(key, *parse_key(key))
+
+    @classmethod
+    def _from_key_shifts(cls, shifts: Tuple[int, ...]) -> "VigenereCipher":
+        """Creates a VigenereCipher straight from the numeric representations of its key, without parsing a key string
+
+        Args:
+            shifts (Tuple[int, ...]): The numeric representation of each key character, between 0 and 25
+
+        Returns:
+            VigenereCipher: the cipher using that key
+        """
+        cipher = cls.__new__(cls)
+        key = "".join(character_representation(list(shifts)))
+        cipher._setup(key, shifts, tuple(make_shift_row(k) for k in shifts))
+        return cipher
+
+    def _setup(
+        self, key: str, shifts: Tuple[int, ...], shift_rows: Tuple[dict, ...]
+    ) -> None:
+        """Sets the key and the pipeline of the cipher
+
+        Args:
+            key (str): The key string
+            shifts (Tuple[int, ...]): The numeric representation of each key character
+            shift_rows (Tuple[dict, ...]): The shift row of each key character
+        """
+        if not shifts:
+            raise ValueError("key must not be empty")
         self.skey = key
-        self.key = numeric_representation(list(key))
+        self.key = shifts
+        self._shift_rows = shift_rows
 
         super().__init__(
             preprocess_raw_string=preprocess_raw_string,
@@ -46,14 +120,53 @@ class VigenereCipher(Encryption):
         Returns:
             List[int]: the encrypted numeric representations of the characters
         """
-        result = []
-        for i in range(len(l)):
-            if l[i] == -65:
-                result.append(-65)
-            else:
-                result.append((l[i] + self.key[i % len(self.key)]) % 26)
-        return result
+        # zip against the cycled key lines every character up with its shift in one pass,
+        # and the shift rows replace the space branch and the modulo with one lookup
+        try:
+            return [row[c] for c, row in zip(l, cycle(self._shift_rows))]
+        except KeyError:
+            return [c if c == -65 else (c + k) % 26 for c, k in zip(l, cycle(self.key))]
+
+
+    def _compile_encrypt(self) -> Callable[[any], any]:
+        """Builds the encrypt function, which shifts plaintexts of letters and spaces column by column with the default pipeline
 
+        Returns:
+            Callable[[any], any]: the specialized encrypt function
+        """
+        encrypt = super()._compile_encrypt()
+        if (
+            self.preprocess_raw_string != [to_lower_case]
+            or self.preprocess != [list, numeric_representation]
+            or self.postprocess != [character_representation, "".join]
+            or self.consolidator != "".join
+        ):
+            return encrypt
+
+        def shift_columns_or_encrypt(plaintext: any) -> any:
+            if isinstance(plaintext, str) and plaintext.isascii():
+                text = plaintext.lower()
+                if text.replace(" ", "").isalpha():
+                    return self._shift_columns(text)
+            return encrypt(plaintext)
+
+        return shift_columns_or_encrypt
+
+    def _shift_columns(self, text: str) -> str:
+        """Encrypts lowercase letters and spaces by translating every k-th character with the same key shift, k being the key length
+
+        Args:
+            text (str): The lowercase ASCII letters and spaces to encrypt
+
+        Returns:
+            str: the encrypted text
+        """
+        b = text.encode("ascii")
+        out = bytearray(b)
+        k = len(self.key)
+        for i, shift in enumerate(self.key):
+            out[i::k] = b[i::k].translate(make_shift_table(shift % 26))
+        return out.decode("ascii")
 
     def print_encryption_table(
         self,
@@ -111,8 +224,7 @@ class VigenereCipher(Encryption):
         Returns:
             VigenereCipher: the reverse VigenereCipher object
         """
-        n_key = "".join(character_representation([-i % 26 for i in self.key]))
-        return VigenereCipher(n_key)
+        return VigenereCipher._from_key_shifts(tuple(-i % 26 for i in self.key))
 
     def __repr__(self) -> str:
         return super().__repr__() + f"[key={self.skey}]"